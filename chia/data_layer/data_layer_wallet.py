@@ -194,7 +194,7 @@ class DataLayerWallet:
 
         if len(coin_states) == 0:
             raise ValueError(f"Launcher ID {launcher_id} is not a valid coin")
-        if coin_states[0].coin.puzzle_hash != SINGLETON_LAUNCHER.get_tree_hash():
+        if coin_states[0].coin.puzzle_hash != SINGLETON_LAUNCHER_HASH:
             raise ValueError(f"Coin with ID {launcher_id} is not a singleton launcher")
         if coin_states[0].created_height is None:
             raise ValueError(f"Launcher with ID {launcher_id} has not been created (maybe reorged)")
@@ -307,7 +307,7 @@ class DataLayerWallet:
             raise ValueError("Not enough coins to create new data layer singleton")
 
         launcher_parent: Coin = list(coins)[0]
-        launcher_coin: Coin = Coin(launcher_parent.name(), SINGLETON_LAUNCHER.get_tree_hash(), uint64(1))
+        launcher_coin: Coin = Coin(launcher_parent.name(), SINGLETON_LAUNCHER_HASH, uint64(1))
 
         inner_puzzle: Program = await self.standard_wallet.get_new_puzzle()
         full_puzzle: Program = create_host_fullpuz(inner_puzzle, initial_root, launcher_coin.name())
@@ -319,7 +319,7 @@ class DataLayerWallet:
         announcement = Announcement(launcher_coin.name(), announcement_message)
         create_launcher_tx_record: Optional[TransactionRecord] = await self.standard_wallet.generate_signed_transaction(
             amount=uint64(1),
-            puzzle_hash=SINGLETON_LAUNCHER.get_tree_hash(),
+            puzzle_hash=SINGLETON_LAUNCHER_HASH,
             fee=fee,
             origin_id=launcher_parent.name(),
             coins=coins,
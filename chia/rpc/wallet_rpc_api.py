@@ -48,6 +48,7 @@ from chia.wallet.did_wallet.did_info import DIDInfo
 from chia.wallet.did_wallet.did_wallet import DIDWallet
 from chia.wallet.did_wallet.did_wallet_puzzles import (
     DID_INNERPUZ_MOD,
+    EMPTY_RECOVERY_LIST_HASH,
     match_did_puzzle,
     metadata_to_program,
     program_to_metadata,
@@ -61,7 +62,7 @@ from chia.wallet.notification_store import Notification
 from chia.wallet.outer_puzzles import AssetType
 from chia.wallet.puzzle_drivers import PuzzleInfo, Solver
 from chia.wallet.puzzles.p2_delegated_puzzle_or_hidden_puzzle import puzzle_hash_for_synthetic_public_key
-from chia.wallet.singleton import create_singleton_puzzle
+from chia.wallet.singleton import create_singleton_puzzle, create_singleton_puzzle_hash
 from chia.wallet.trade_record import TradeRecord
 from chia.wallet.trading.offer import Offer
 from chia.wallet.transaction_record import TransactionRecord
@@ -1793,7 +1794,8 @@ class WalletRpcApi:
         puzzle_announcements: Set[bytes] = set([])
         for pa in request.get("puzzle_announcements", []):
             puzzle_announcements.add(bytes.fromhex(pa))
-        spend_bundle = await wallet.create_message_spend(coin_announcements, puzzle_announcements)
+        async with self.service.wallet_state_manager.lock:
+            spend_bundle = await wallet.create_message_spend(coin_announcements, puzzle_announcements)
         return {"success": True, "spend_bundle": spend_bundle}
 
     async def did_get_info(self, request) -> EndpointResult:
@@ -1892,7 +1894,7 @@ class WalletRpcApi:
             )
             full_puzzle = create_singleton_puzzle(did_puzzle, launcher_id)
             did_puzzle_empty_recovery = DID_INNERPUZ_MOD.curry(
-                our_inner_puzzle, Program.to([]).get_tree_hash(), uint64(0), singleton_struct, metadata
+                our_inner_puzzle, EMPTY_RECOVERY_LIST_HASH, uint64(0), singleton_struct, metadata
             )
             # Check if we have the DID wallet
             did_wallet: Optional[DIDWallet] = None
@@ -1910,7 +1912,7 @@ class WalletRpcApi:
                 elif (
                     did_wallet is not None
                     and did_wallet.did_info.current_inner is not None
-                    and create_singleton_puzzle(did_wallet.did_info.current_inner, launcher_id).get_tree_hash()
+                    and create_singleton_puzzle_hash(did_wallet.did_info.current_inner.get_tree_hash(), launcher_id)
                     == coin_state.coin.puzzle_hash
                 ):
                     # Check if the old wallet has the inner puzzle
@@ -1959,68 +1961,72 @@ class WalletRpcApi:
                             f" because the last spend updated recovery_list_hash/num_verification/metadata.",
                         }
 
-            if did_wallet is None:
-                # Create DID wallet
-                response: List[CoinState] = await self.service.get_coin_state([launcher_id], peer=peer)
-                if len(response) == 0:
-                    return {"success": False, "error": f"Could not find the launch coin with ID: {launcher_id.hex()}"}
-                launcher_coin: CoinState = response[0]
-                did_wallet = await DIDWallet.create_new_did_wallet_from_coin_spend(
-                    self.service.wallet_state_manager,
-                    self.service.wallet_state_manager.main_wallet,
-                    launcher_coin.coin,
-                    did_puzzle,
-                    coin_spend,
-                    f"DID {encode_puzzle_hash(launcher_id, AddressType.DID.hrp(self.service.config))}",
-                )
-            else:
-                assert did_wallet.did_info.current_inner is not None
-                if did_wallet.did_info.current_inner.get_tree_hash() != did_puzzle.get_tree_hash():
-                    # Inner DID puzzle doesn't match, we need to update the DID info
-                    full_solution: Program = Program.from_bytes(bytes(coin_spend.solution))
-                    inner_solution: Program = full_solution.rest().rest().first()
-                    recovery_list: List[bytes32] = []
-                    backup_required: int = num_verification.as_int()
-                    if recovery_list_hash != Program.to([]).get_tree_hash():
-                        try:
-                            for did in inner_solution.rest().rest().rest().rest().rest().as_python():
-                                recovery_list.append(did[0])
-                        except Exception:
-                            # We cannot recover the recovery list, but it's okay to leave it blank
-                            pass
-                    did_info: DIDInfo = DIDInfo(
-                        did_wallet.did_info.origin_coin,
-                        recovery_list,
-                        uint64(backup_required),
-                        [],
+            async with self.service.wallet_state_manager.lock:
+                if did_wallet is None:
+                    # Create DID wallet
+                    response: List[CoinState] = await self.service.get_coin_state([launcher_id], peer=peer)
+                    if len(response) == 0:
+                        return {
+                            "success": False,
+                            "error": f"Could not find the launch coin with ID: {launcher_id.hex()}",
+                        }
+                    launcher_coin: CoinState = response[0]
+                    did_wallet = await DIDWallet.create_new_did_wallet_from_coin_spend(
+                        self.service.wallet_state_manager,
+                        self.service.wallet_state_manager.main_wallet,
+                        launcher_coin.coin,
                         did_puzzle,
-                        None,
-                        None,
-                        None,
-                        False,
-                        json.dumps(did_wallet_puzzles.program_to_metadata(metadata)),
+                        coin_spend,
+                        f"DID {encode_puzzle_hash(launcher_id, AddressType.DID.hrp(self.service.config))}",
                     )
-                    await did_wallet.save_info(did_info)
-                    await self.service.wallet_state_manager.update_wallet_puzzle_hashes(did_wallet.wallet_info.id)
-
-            try:
-                coins = await did_wallet.select_coins(uint64(1))
-                coin = coins.pop()
-                if coin.name() == coin_state.coin.name():
-                    return {"success": True, "latest_coin_id": coin.name().hex()}
-            except ValueError:
-                # We don't have any coin for this wallet, add the coin
-                pass
-
-            wallet_id = did_wallet.id()
-            wallet_type = did_wallet.type()
-            assert coin_state.created_height is not None
-            coin_record: WalletCoinRecord = WalletCoinRecord(
-                coin_state.coin, uint32(coin_state.created_height), uint32(0), False, False, wallet_type, wallet_id
-            )
-            await self.service.wallet_state_manager.coin_store.add_coin_record(coin_record, coin_state.coin.name())
-            await did_wallet.coin_added(coin_state.coin, uint32(coin_state.created_height), peer)
-            return {"success": True, "latest_coin_id": coin_state.coin.name().hex()}
+                else:
+                    assert did_wallet.did_info.current_inner is not None
+                    if did_wallet.did_info.current_inner.get_tree_hash() != did_puzzle.get_tree_hash():
+                        # Inner DID puzzle doesn't match, we need to update the DID info
+                        full_solution: Program = Program.from_bytes(bytes(coin_spend.solution))
+                        inner_solution: Program = full_solution.rest().rest().first()
+                        recovery_list: List[bytes32] = []
+                        backup_required: int = num_verification.as_int()
+                        if recovery_list_hash != EMPTY_RECOVERY_LIST_HASH:
+                            try:
+                                for did in inner_solution.rest().rest().rest().rest().rest().as_python():
+                                    recovery_list.append(did[0])
+                            except Exception:
+                                # We cannot recover the recovery list, but it's okay to leave it blank
+                                pass
+                        did_info: DIDInfo = DIDInfo(
+                            did_wallet.did_info.origin_coin,
+                            recovery_list,
+                            uint64(backup_required),
+                            [],
+                            did_puzzle,
+                            None,
+                            None,
+                            None,
+                            False,
+                            json.dumps(did_wallet_puzzles.program_to_metadata(metadata)),
+                        )
+                        await did_wallet.save_info(did_info)
+                        await self.service.wallet_state_manager.update_wallet_puzzle_hashes(did_wallet.wallet_info.id)
+
+                try:
+                    coins = await did_wallet.select_coins(uint64(1))
+                    coin = coins.pop()
+                    if coin.name() == coin_state.coin.name():
+                        return {"success": True, "latest_coin_id": coin.name().hex()}
+                except ValueError:
+                    # We don't have any coin for this wallet, add the coin
+                    pass
+
+                wallet_id = did_wallet.id()
+                wallet_type = did_wallet.type()
+                assert coin_state.created_height is not None
+                coin_record: WalletCoinRecord = WalletCoinRecord(
+                    coin_state.coin, uint32(coin_state.created_height), uint32(0), False, False, wallet_type, wallet_id
+                )
+                await self.service.wallet_state_manager.coin_store.add_coin_record(coin_record, coin_state.coin.name())
+                await did_wallet.coin_added(coin_state.coin, uint32(coin_state.created_height), peer)
+                return {"success": True, "latest_coin_id": coin_state.coin.name().hex()}
 
     async def did_update_metadata(self, request) -> EndpointResult:
         wallet_id = uint32(request["wallet_id"])
@@ -2167,7 +2173,8 @@ class WalletRpcApi:
         my_did = encode_puzzle_hash(
             bytes32.from_hexstr(did_wallet.get_my_DID()), AddressType.DID.hrp(self.service.config)
         )
-        did_coin_threeple = await did_wallet.get_info_for_recovery()
+        async with self.service.wallet_state_manager.lock:
+            did_coin_threeple = await did_wallet.get_info_for_recovery()
         assert my_did is not None
         assert did_coin_threeple is not None
         return {
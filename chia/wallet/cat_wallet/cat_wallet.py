@@ -187,12 +187,11 @@ class CATWallet:
 
         limitations_program_hash_hex = bytes32.from_hexstr(limitations_program_hash_hex).hex()  # Normalize the format
 
-        for id, w in wallet_state_manager.wallets.items():
-            if w.type() == CATWallet.type():
-                assert isinstance(w, CATWallet)
-                if w.get_asset_id() == limitations_program_hash_hex:
-                    self.log.warning("Not creating wallet for already existing CAT wallet")
-                    return w
+        tail_hash = bytes32.from_hexstr(limitations_program_hash_hex)
+        existing_wallet = wallet_state_manager.get_cat_wallet_for_tail(tail_hash)
+        if existing_wallet is not None:
+            self.log.warning("Not creating wallet for already existing CAT wallet")
+            return existing_wallet
 
         self.wallet_state_manager = wallet_state_manager
         if limitations_program_hash_hex in DEFAULT_CATS:
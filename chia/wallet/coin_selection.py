@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import random
-from typing import Dict, List, Optional, Set
+from typing import Collection, Dict, List, Optional, Set
 
 from chia.types.blockchain_format.coin import Coin
 from chia.types.blockchain_format.sized_bytes import bytes32
@@ -13,7 +13,7 @@ from chia.wallet.wallet_coin_record import WalletCoinRecord
 async def select_coins(
     spendable_amount: uint128,
     max_coin_amount: uint64,
-    spendable_coins: List[WalletCoinRecord],
+    spendable_coins: Collection[WalletCoinRecord],
     unconfirmed_removals: Dict[bytes32, Coin],
     log: logging.Logger,
     amount: uint128,
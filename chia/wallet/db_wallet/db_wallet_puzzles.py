@@ -15,15 +15,16 @@ from chia.wallet.puzzles.load_clvm import load_clvm_maybe_recompile
 ACS_MU = Program.to(11)  # returns the third argument a.k.a the full solution
 ACS_MU_PH = ACS_MU.get_tree_hash()
 SINGLETON_TOP_LAYER_MOD = load_clvm_maybe_recompile("singleton_top_layer_v1_1.clsp")
+SINGLETON_TOP_LAYER_MOD_HASH = SINGLETON_TOP_LAYER_MOD.get_tree_hash()
 SINGLETON_LAUNCHER = load_clvm_maybe_recompile("singleton_launcher.clsp")
+SINGLETON_LAUNCHER_HASH = SINGLETON_LAUNCHER.get_tree_hash()
 GRAFTROOT_DL_OFFERS = load_clvm_maybe_recompile("graftroot_dl_offers.clsp")
 P2_PARENT = load_clvm_maybe_recompile("p2_parent.clsp")
 
 
 def create_host_fullpuz(innerpuz: Union[Program, bytes32], current_root: bytes32, genesis_id: bytes32) -> Program:
     db_layer = create_host_layer_puzzle(innerpuz, current_root)
-    mod_hash = SINGLETON_TOP_LAYER_MOD.get_tree_hash()
-    singleton_struct = Program.to((mod_hash, (genesis_id, SINGLETON_LAUNCHER.get_tree_hash())))
+    singleton_struct = Program.to((SINGLETON_TOP_LAYER_MOD_HASH, (genesis_id, SINGLETON_LAUNCHER_HASH)))
     return SINGLETON_TOP_LAYER_MOD.curry(singleton_struct, db_layer)
 
 
@@ -67,9 +68,7 @@ def launch_solution_to_singleton_info(launch_solution: Program) -> Tuple[bytes32
 
 
 def launcher_to_struct(launcher_id: bytes32) -> Program:
-    struct: Program = Program.to(
-        (SINGLETON_TOP_LAYER_MOD.get_tree_hash(), (launcher_id, SINGLETON_LAUNCHER.get_tree_hash()))
-    )
+    struct: Program = Program.to((SINGLETON_TOP_LAYER_MOD_HASH, (launcher_id, SINGLETON_LAUNCHER_HASH)))
     return struct
 
 
@@ -96,7 +95,7 @@ def get_mirror_info(parent_puzzle: Program, parent_solution: Program) -> Tuple[b
     for condition in conditions.as_iter():
         if (
             condition.first().as_python() == ConditionOpcode.CREATE_COIN
-            and condition.at("rf").as_python() == create_mirror_puzzle().get_tree_hash()
+            and condition.at("rf").as_python() == MIRROR_PUZZLE_HASH
         ):
             memos: List[bytes] = condition.at("rrrf").as_python()
             launcher_id = bytes32(memos[0])
@@ -3,7 +3,6 @@ from __future__ import annotations
 import dataclasses
 import json
 import logging
-import re
 import time
 from secrets import token_bytes
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
@@ -22,6 +21,7 @@ from chia.types.coin_spend import CoinSpend
 from chia.types.spend_bundle import SpendBundle
 from chia.util.condition_tools import conditions_dict_for_solution, pkm_pairs_for_conditions_dict
 from chia.util.ints import uint32, uint64, uint128
+from chia.wallet.cat_wallet.cat_utils import NULL_SIGNATURE
 from chia.wallet.coin_selection import select_coins
 from chia.wallet.derivation_record import DerivationRecord
 from chia.wallet.derive_keys import master_sk_to_wallet_sk_unhardened
@@ -37,6 +37,7 @@ from chia.wallet.puzzles.p2_delegated_puzzle_or_hidden_puzzle import (
 )
 from chia.wallet.singleton import (
     SINGLETON_LAUNCHER_PUZZLE,
+    SINGLETON_LAUNCHER_PUZZLE_HASH,
     create_singleton_puzzle,
     create_singleton_puzzle_hash,
     get_inner_puzzle_from_singleton,
@@ -50,6 +51,10 @@ from chia.wallet.wallet import CHIP_0002_SIGN_MESSAGE_PREFIX, Wallet
 from chia.wallet.wallet_coin_record import WalletCoinRecord
 from chia.wallet.wallet_info import WalletInfo
 
+# 128-byte zero placeholder for the launcher solution's key/value slot, kept for on-chain compatibility.
+# It is bytes(0x80), not bytes([0x80]); changing it changes the launcher announcement.
+LAUNCHER_KEY_VALUE_LIST = bytes(0x80)
+
 
 class DIDWallet:
     wallet_state_manager: Any
@@ -60,6 +65,11 @@ class DIDWallet:
     base_puzzle_program: Optional[bytes]
     base_inner_puzzle_hash: Optional[bytes32]
     wallet_id: int
+    # Index over did_info.parent_info, rebuilt whenever a new parent_info list is seen
+    _parent_info_by_coin: Dict[bytes32, Optional[LineageProof]]
+    _parent_info_source: Optional[List[Tuple[bytes32, Optional[LineageProof]]]] = None
+    # (did_info.metadata, metadata program) for the last metadata string that was converted
+    _metadata_program_cache: Optional[Tuple[str, Program]] = None
 
     @staticmethod
     async def create_new_did_wallet(
@@ -93,7 +103,7 @@ class DIDWallet:
         self.base_puzzle_program = None
         self.base_inner_puzzle_hash = None
         self.standard_wallet = wallet
-        self.log = logging.getLogger(name if name else __name__)
+        self.log = logging.getLogger(__name__)
         std_wallet_id = self.standard_wallet.wallet_id
         bal = await wallet_state_manager.get_confirmed_balance_for_wallet(std_wallet_id)
         if amount > bal:
@@ -113,10 +123,6 @@ class DIDWallet:
             name, WalletType.DECENTRALIZED_ID.value, info_as_string
         )
         self.wallet_id = self.wallet_info.id
-        std_wallet_id = self.standard_wallet.wallet_id
-        bal = await wallet_state_manager.get_confirmed_balance_for_wallet(std_wallet_id)
-        if amount > bal:
-            raise ValueError("Not enough balance")
 
         try:
             spend_bundle = await self.generate_new_decentralised_id(amount, fee)
@@ -153,7 +159,7 @@ class DIDWallet:
         self.base_puzzle_program = None
         self.base_inner_puzzle_hash = None
         self.standard_wallet = wallet
-        self.log = logging.getLogger(name if name else __name__)
+        self.log = logging.getLogger(__name__)
         self.log.info("Creating DID wallet from recovery file ...")
         # load backup will also set our DIDInfo
         self.did_info = DIDWallet.deserialize_backup_data(backup_data)
@@ -163,7 +169,6 @@ class DIDWallet:
             name, WalletType.DECENTRALIZED_ID.value, info_as_string
         )
         await self.wallet_state_manager.add_new_wallet(self)
-        await self.save_info(self.did_info)
         await self.wallet_state_manager.update_wallet_puzzle_hashes(self.wallet_info.id)
         await self.load_parent(self.did_info)
         if self.wallet_info is None:
@@ -198,7 +203,7 @@ class DIDWallet:
         self.base_puzzle_program = None
         self.base_inner_puzzle_hash = None
         self.standard_wallet = wallet
-        self.log = logging.getLogger(name if name else __name__)
+        self.log = logging.getLogger(__name__)
 
         self.log.info(f"Creating DID wallet from a coin spend {launch_coin}  ...")
         # Create did info from the coin spend
@@ -210,7 +215,7 @@ class DIDWallet:
         inner_solution: Program = full_solution.rest().rest().first()
         recovery_list: List[bytes32] = []
         backup_required: int = num_verification.as_int()
-        if recovery_list_hash != Program.to([]).get_tree_hash():
+        if recovery_list_hash != did_wallet_puzzles.EMPTY_RECOVERY_LIST_HASH:
             try:
                 for did in inner_solution.rest().rest().rest().rest().rest().as_python():
                     recovery_list.append(did[0])
@@ -240,7 +245,7 @@ class DIDWallet:
         await self.wallet_state_manager.add_new_wallet(self)
         await self.wallet_state_manager.update_wallet_puzzle_hashes(self.wallet_info.id)
         await self.load_parent(self.did_info)
-        self.log.info(f"New DID wallet created {info_as_string}.")
+        self.log.info(f"New DID wallet {self.wallet_info.id} created {info_as_string}.")
         if self.wallet_info is None:
             raise ValueError("Internal Error")
         self.wallet_id = self.wallet_info.id
@@ -251,18 +256,16 @@ class DIDWallet:
         wallet_state_manager: Any,
         wallet: Wallet,
         wallet_info: WalletInfo,
-        name: str = None,
     ):
         """
         Create a DID wallet based on the local database
         :param wallet_state_manager: Wallet state manager
         :param wallet: Standard wallet
         :param wallet_info: Serialized WalletInfo
-        :param name: Wallet name
         :return:
         """
         self = DIDWallet()
-        self.log = logging.getLogger(name if name else __name__)
+        self.log = logging.getLogger(__name__)
         self.wallet_state_manager = wallet_state_manager
         self.wallet_info = wallet_info
         self.wallet_id = wallet_info.id
@@ -290,7 +293,7 @@ class DIDWallet:
             if parent is not None:
                 amount = uint128(amount + record.coin.amount)
 
-        self.log.info(f"Confirmed balance for did wallet is {amount}")
+        self.log.info("Confirmed balance for did wallet %s is %s", self.id(), amount)
         return uint128(amount)
 
     async def get_pending_change_balance(self) -> uint64:
@@ -329,17 +332,16 @@ class DIDWallet:
         Note: Must be called under wallet state manager lock
         """
 
-        spendable_amount: uint128 = await self.get_spendable_balance()
+        spendable_coins: Set[WalletCoinRecord] = await self.wallet_state_manager.get_spendable_coins_for_wallet(
+            self.wallet_info.id
+        )
+        spendable_amount = uint128(sum(record.coin.amount for record in spendable_coins))
 
         if amount > spendable_amount:
             error_msg = f"Can't select {amount}, from spendable {spendable_amount} for wallet id {self.id()}"
             self.log.warning(error_msg)
             raise ValueError(error_msg)
 
-        spendable_coins: List[WalletCoinRecord] = list(
-            await self.wallet_state_manager.get_spendable_coins_for_wallet(self.wallet_info.id)
-        )
-
         # Try to use coins from the store, if there isn't enough of "unused"
         # coins use change coins that are not confirmed yet
         unconfirmed_removals: Dict[bytes32, Coin] = await self.wallet_state_manager.unconfirmed_removals_for_wallet(
@@ -376,6 +378,7 @@ class DIDWallet:
     async def coin_added(self, coin: Coin, _: uint32, peer: WSChiaConnection):
         """Notification from wallet state manager that wallet has been received."""
 
+        new_parents: List[Tuple[bytes32, Optional[LineageProof]]] = []
         parent = self.get_parent_for_coin(coin)
         if parent is None:
             # this is the first time we received it, check it's a DID coin
@@ -396,44 +399,38 @@ class DIDWallet:
                     parent_innerpuz.get_tree_hash(),
                     uint64(parent_state.coin.amount),
                 )
-
-                await self.add_parent(coin.parent_coin_info, parent_info)
+                new_parents.append((coin.parent_coin_info, parent_info))
             else:
-                self.log.warning("Parent coin is not a DID, skipping: %s -> %s", coin.name(), coin)
+                self.log.warning(
+                    "Parent coin is not a DID, skipping for wallet %s: %s -> %s", self.id(), coin.name(), coin
+                )
                 return
-        self.log.info(f"DID wallet has been notified that coin was added: {coin.name()}:{coin}")
+        if self.log.isEnabledFor(logging.INFO):
+            self.log.info("DID wallet %s has been notified that coin was added: %s:%s", self.id(), coin.name(), coin)
         inner_puzzle = await self.inner_puzzle_for_did_puzzle(coin.puzzle_hash)
+        inner_puzzle_hash = inner_puzzle.get_tree_hash()
         # Check inner puzzle consistency
         assert self.did_info.origin_coin is not None
 
         # TODO: if not the first singleton, and solution mode == recovery
         if not self._coin_is_first_singleton(coin):
-            full_puzzle = create_singleton_puzzle(inner_puzzle, self.did_info.origin_coin.name())
-            assert full_puzzle.get_tree_hash() == coin.puzzle_hash
+            full_puzzle_hash = create_singleton_puzzle_hash(inner_puzzle_hash, self.did_info.origin_coin.name())
+            assert full_puzzle_hash == coin.puzzle_hash
         if self.did_info.temp_coin is not None:
             self.wallet_state_manager.state_changed("did_coin_added", self.wallet_info.id)
 
-        new_info = DIDInfo(
-            self.did_info.origin_coin,
-            self.did_info.backup_ids,
-            self.did_info.num_of_backup_ids_needed,
-            self.did_info.parent_info,
-            inner_puzzle,
-            None,
-            None,
-            None,
-            False,
-            self.did_info.metadata,
-        )
-        await self.save_info(new_info)
-
         future_parent = LineageProof(
             coin.parent_coin_info,
-            inner_puzzle.get_tree_hash(),
+            inner_puzzle_hash,
             uint64(coin.amount),
         )
-
-        await self.add_parent(coin.name(), future_parent)
+        new_parents.append((coin.name(), future_parent))
+        # Record the new inner puzzle and lineage in a single write
+        await self.save_singleton_state(
+            new_parents,
+            origin_coin=self.did_info.origin_coin,
+            current_inner=inner_puzzle,
+        )
 
     def create_backup(self) -> str:
         """
@@ -472,12 +469,17 @@ class DIDWallet:
             did_info.backup_ids,
             did_info.num_of_backup_ids_needed,
             did_info.origin_coin.name(),
-            did_wallet_puzzles.metadata_to_program(json.loads(self.did_info.metadata)),
+            self._get_metadata_program(),
         )
+        current_inner_hash = did_info.current_inner.get_tree_hash()
         wallet_node = self.wallet_state_manager.wallet_node
+        # Walk the whole lineage against one peer so that its validation cache is reused between generations
+        peer = wallet_node.get_full_node_peer()
         parent_coin: Coin = did_info.origin_coin
+        temp_coin: Optional[Coin] = None
+        # Collect the lineage proofs and write them with a single save_info once the walk is done
+        new_parents: List[Tuple[bytes32, Optional[LineageProof]]] = []
         while True:
-            peer = wallet_node.get_full_node_peer()
             children = await wallet_node.fetch_children(parent_coin.name(), peer)
             if len(children) == 0:
                 break
@@ -486,25 +488,12 @@ class DIDWallet:
             child_coin = children_state.coin
             future_parent = LineageProof(
                 child_coin.parent_coin_info,
-                did_info.current_inner.get_tree_hash(),
+                current_inner_hash,
                 uint64(child_coin.amount),
             )
-            await self.add_parent(child_coin.name(), future_parent)
+            new_parents.append((child_coin.name(), future_parent))
             if children_state.spent_height != children_state.created_height:
-                did_info = DIDInfo(
-                    did_info.origin_coin,
-                    did_info.backup_ids,
-                    did_info.num_of_backup_ids_needed,
-                    self.did_info.parent_info,
-                    did_info.current_inner,
-                    child_coin,
-                    new_did_inner_puzhash,
-                    bytes(new_pubkey),
-                    did_info.sent_recovery_transaction,
-                    did_info.metadata,
-                )
-
-                await self.save_info(did_info)
+                temp_coin = child_coin
                 assert children_state.created_height
                 parent_spend = await fetch_coin_spend(uint32(children_state.created_height), parent_coin, peer)
                 assert parent_spend is not None
@@ -515,9 +504,18 @@ class DIDWallet:
                     parent_innerpuz.get_tree_hash(),
                     uint64(parent_coin.amount),
                 )
-                await self.add_parent(child_coin.parent_coin_info, parent_info)
+                new_parents.append((child_coin.parent_coin_info, parent_info))
             parent_coin = child_coin
         assert parent_info is not None
+        await self.save_singleton_state(
+            new_parents,
+            origin_coin=did_info.origin_coin,
+            current_inner=did_info.current_inner,
+            temp_coin=temp_coin,
+            temp_puzhash=new_did_inner_puzhash,
+            temp_pubkey=bytes(new_pubkey),
+            sent_recovery_transaction=did_info.sent_recovery_transaction,
+        )
 
     def puzzle_for_pk(self, pubkey: G1Element) -> Program:
         if self.did_info.origin_coin is not None:
@@ -526,7 +524,7 @@ class DIDWallet:
                 self.did_info.backup_ids,
                 self.did_info.num_of_backup_ids_needed,
                 self.did_info.origin_coin.name(),
-                did_wallet_puzzles.metadata_to_program(json.loads(self.did_info.metadata)),
+                self._get_metadata_program(),
             )
             return create_singleton_puzzle(innerpuz, self.did_info.origin_coin.name())
         else:
@@ -543,7 +541,7 @@ class DIDWallet:
             self.did_info.backup_ids,
             self.did_info.num_of_backup_ids_needed,
             origin_coin_name,
-            did_wallet_puzzles.metadata_to_program(json.loads(self.did_info.metadata)),
+            self._get_metadata_program(),
         )
         return create_singleton_puzzle_hash(innerpuz_hash, origin_coin_name)
 
@@ -559,8 +557,6 @@ class DIDWallet:
         return core.hex()
 
     async def set_name(self, new_name: str):
-        import dataclasses
-
         new_info = dataclasses.replace(self.wallet_info, name=new_name)
         self.wallet_info = new_info
         await self.wallet_state_manager.user_store.update_wallet(self.wallet_info)
@@ -628,7 +624,7 @@ class DIDWallet:
         )
         new_coin = Coin(coin.name(), new_full_puzzle.get_tree_hash(), coin.amount)
         list_of_coinspends = [CoinSpend(coin, full_puzzle, fullsol), CoinSpend(new_coin, new_full_puzzle, new_full_sol)]
-        unsigned_spend_bundle = SpendBundle(list_of_coinspends, G2Element())
+        unsigned_spend_bundle = SpendBundle(list_of_coinspends, NULL_SIGNATURE)
         spend_bundle = await self.sign(unsigned_spend_bundle)
         if fee > 0:
             announcement_to_make = coin.name()
@@ -693,7 +689,7 @@ class DIDWallet:
             backup_ids,
             backup_required,
             self.did_info.origin_coin.name(),
-            did_wallet_puzzles.metadata_to_program(json.loads(self.did_info.metadata)),
+            self._get_metadata_program(),
         )
         p2_solution = self.standard_wallet.make_solution(
             primaries=[
@@ -731,7 +727,7 @@ class DIDWallet:
             ]
         )
         list_of_coinspends = [CoinSpend(coin, full_puzzle, fullsol)]
-        unsigned_spend_bundle = SpendBundle(list_of_coinspends, G2Element())
+        unsigned_spend_bundle = SpendBundle(list_of_coinspends, NULL_SIGNATURE)
         spend_bundle = await self.sign(unsigned_spend_bundle)
         if fee > 0:
             announcement_to_make = coin.name()
@@ -817,7 +813,7 @@ class DIDWallet:
             ]
         )
         list_of_coinspends = [CoinSpend(coin, full_puzzle, fullsol)]
-        unsigned_spend_bundle = SpendBundle(list_of_coinspends, G2Element())
+        unsigned_spend_bundle = SpendBundle(list_of_coinspends, NULL_SIGNATURE)
         return await self.sign(unsigned_spend_bundle)
 
     # This is used to cash out, or update the id_list
@@ -852,7 +848,7 @@ class DIDWallet:
             ]
         )
         list_of_coinspends = [CoinSpend(coin, full_puzzle, fullsol)]
-        unsigned_spend_bundle = SpendBundle(list_of_coinspends, G2Element())
+        unsigned_spend_bundle = SpendBundle(list_of_coinspends, NULL_SIGNATURE)
         spend_bundle = await self.sign(unsigned_spend_bundle)
 
         did_record = TransactionRecord(
@@ -896,6 +892,7 @@ class DIDWallet:
         message = did_wallet_puzzles.create_recovery_message_puzzle(recovering_coin_name, newpuz, pubkey)
         innermessage = message.get_tree_hash()
         innerpuz: Program = self.did_info.current_inner
+        innerpuz_hash = innerpuz.get_tree_hash()
         uncurried = did_wallet_puzzles.uncurry_innerpuz(innerpuz)
         assert uncurried is not None
         p2_puzzle = uncurried[0]
@@ -903,7 +900,7 @@ class DIDWallet:
         p2_solution = self.standard_wallet.make_solution(
             primaries=[
                 {
-                    "puzzlehash": innerpuz.get_tree_hash(),
+                    "puzzlehash": innerpuz_hash,
                     "amount": uint64(coin.amount),
                     "memos": [p2_puzzle.get_tree_hash()],
                 },
@@ -933,8 +930,8 @@ class DIDWallet:
         )
         list_of_coinspends = [CoinSpend(coin, full_puzzle, fullsol)]
         message_spend = did_wallet_puzzles.create_spend_for_message(coin.name(), recovering_coin_name, newpuz, pubkey)
-        message_spend_bundle = SpendBundle([message_spend], AugSchemeMPL.aggregate([]))
-        unsigned_spend_bundle = SpendBundle(list_of_coinspends, G2Element())
+        message_spend_bundle = SpendBundle([message_spend], NULL_SIGNATURE)
+        unsigned_spend_bundle = SpendBundle(list_of_coinspends, NULL_SIGNATURE)
         spend_bundle = await self.sign(unsigned_spend_bundle)
         did_record = TransactionRecord(
             confirmed_at_height=uint32(0),
@@ -955,7 +952,7 @@ class DIDWallet:
             memos=list(compute_memos(spend_bundle).items()),
         )
         attest_str: str = f"{self.get_my_DID()}:{bytes(message_spend_bundle).hex()}:{coin.parent_coin_info.hex()}:"
-        attest_str += f"{self.did_info.current_inner.get_tree_hash().hex()}:{coin.amount}"
+        attest_str += f"{innerpuz_hash.hex()}:{coin.amount}"
         await self.wallet_state_manager.add_pending_transaction(did_record)
         return message_spend_bundle, attest_str
 
@@ -1112,7 +1109,7 @@ class DIDWallet:
                 self.did_info.backup_ids,
                 uint64(self.did_info.num_of_backup_ids_needed),
                 self.did_info.origin_coin.name(),
-                did_wallet_puzzles.metadata_to_program(json.loads(self.did_info.metadata)),
+                self._get_metadata_program(),
             )
         elif origin_id is not None:
             innerpuz = did_wallet_puzzles.create_innerpuz(
@@ -1120,7 +1117,7 @@ class DIDWallet:
                 self.did_info.backup_ids,
                 uint64(self.did_info.num_of_backup_ids_needed),
                 origin_id,
-                did_wallet_puzzles.metadata_to_program(json.loads(self.did_info.metadata)),
+                self._get_metadata_program(),
             )
         else:
             raise ValueError("must have origin coin")
@@ -1145,7 +1142,7 @@ class DIDWallet:
             self.did_info.backup_ids,
             uint64(self.did_info.num_of_backup_ids_needed),
             self.did_info.origin_coin.name(),
-            did_wallet_puzzles.metadata_to_program(json.loads(self.did_info.metadata)),
+            self._get_metadata_program(),
         )
 
     async def inner_puzzle_for_did_puzzle(self, did_hash: bytes32) -> Program:
@@ -1171,18 +1168,22 @@ class DIDWallet:
             self.did_info.backup_ids,
             self.did_info.num_of_backup_ids_needed,
             self.did_info.origin_coin.name(),
-            did_wallet_puzzles.metadata_to_program(json.loads(self.did_info.metadata)),
+            self._get_metadata_program(),
             old_recovery_list_hash,
         )
         return inner_puzzle
 
-    def get_parent_for_coin(self, coin) -> Optional[LineageProof]:
-        parent_info = None
-        for name, ccparent in self.did_info.parent_info:
-            if name == coin.parent_coin_info:
-                parent_info = ccparent
+    def _get_metadata_program(self) -> Program:
+        metadata = self.did_info.metadata
+        if self._metadata_program_cache is None or self._metadata_program_cache[0] != metadata:
+            self._metadata_program_cache = (metadata, did_wallet_puzzles.metadata_to_program(json.loads(metadata)))
+        return self._metadata_program_cache[1]
 
-        return parent_info
+    def get_parent_for_coin(self, coin) -> Optional[LineageProof]:
+        if self._parent_info_source is not self.did_info.parent_info:
+            self._parent_info_by_coin = dict(self.did_info.parent_info)
+            self._parent_info_source = self.did_info.parent_info
+        return self._parent_info_by_coin.get(coin.parent_coin_info)
 
     async def sign_message(self, message: str, is_hex: bool = False) -> Tuple[G1Element, G2Element]:
         if self.did_info.current_inner is None:
@@ -1203,16 +1204,17 @@ class DIDWallet:
             raise ValueError("Invalid inner DID puzzle.")
 
     async def sign(self, spend_bundle: SpendBundle) -> SpendBundle:
-        sigs: List[G2Element] = []
+        sigs: List[G2Element] = [spend_bundle.aggregated_signature]
         for spend in spend_bundle.coin_spends:
-            puzzle_args = did_wallet_puzzles.match_did_puzzle(*spend.puzzle_reveal.to_program().uncurry())
+            puzzle_reveal = spend.puzzle_reveal.to_program()
+            puzzle_args = did_wallet_puzzles.match_did_puzzle(*puzzle_reveal.uncurry())
             if puzzle_args is not None:
                 p2_puzzle, _, _, _, _ = puzzle_args
                 puzzle_hash = p2_puzzle.get_tree_hash()
                 pubkey, private = await self.wallet_state_manager.get_keys(puzzle_hash)
                 synthetic_secret_key = calculate_synthetic_secret_key(private, DEFAULT_HIDDEN_PUZZLE_HASH)
                 conditions = conditions_dict_for_solution(
-                    spend.puzzle_reveal.to_program(),
+                    puzzle_reveal,
                     spend.solution.to_program(),
                     self.wallet_state_manager.constants.MAX_BLOCK_COST_CLVM,
                 )
@@ -1226,8 +1228,8 @@ class DIDWallet:
                     except AssertionError:
                         raise ValueError("This spend bundle cannot be signed by the DID wallet")
 
-        agg_sig = AugSchemeMPL.aggregate(sigs)
-        return SpendBundle.aggregate([spend_bundle, SpendBundle([], agg_sig)])
+        # Fold the bundle's existing signature into the same aggregation as the new ones
+        return SpendBundle(spend_bundle.coin_spends, AugSchemeMPL.aggregate(sigs))
 
     async def generate_new_decentralised_id(self, amount: uint64, fee: uint64 = uint64(0)) -> Optional[SpendBundle]:
         """
@@ -1238,28 +1240,27 @@ class DIDWallet:
         if coins is None:
             return None
 
-        origin = coins.copy().pop()
+        origin = next(iter(coins))
+        origin_id = origin.name()
         genesis_launcher_puz = SINGLETON_LAUNCHER_PUZZLE
-        launcher_coin = Coin(origin.name(), genesis_launcher_puz.get_tree_hash(), amount)
+        launcher_coin = Coin(origin_id, SINGLETON_LAUNCHER_PUZZLE_HASH, amount)
+        launcher_id = launcher_coin.name()
 
-        did_inner: Program = await self.get_new_did_innerpuz(launcher_coin.name())
+        did_inner: Program = await self.get_new_did_innerpuz(launcher_id)
         did_inner_hash = did_inner.get_tree_hash()
-        did_full_puz = create_singleton_puzzle(did_inner, launcher_coin.name())
-        did_puzzle_hash = did_full_puz.get_tree_hash()
+        did_full_puz = create_singleton_puzzle(did_inner, launcher_id)
+        did_puzzle_hash = create_singleton_puzzle_hash(did_inner_hash, launcher_id)
 
-        announcement_set: Set[Announcement] = set()
-        announcement_message = Program.to([did_puzzle_hash, amount, bytes(0x80)]).get_tree_hash()
-        announcement_set.add(Announcement(launcher_coin.name(), announcement_message))
+        genesis_launcher_solution = Program.to([did_puzzle_hash, amount, LAUNCHER_KEY_VALUE_LIST])
+        announcement_message = genesis_launcher_solution.get_tree_hash()
+        announcement_set: Set[Announcement] = {Announcement(launcher_id, announcement_message)}
 
         tx_record: Optional[TransactionRecord] = await self.standard_wallet.generate_signed_transaction(
-            amount, genesis_launcher_puz.get_tree_hash(), fee, origin.name(), coins, None, False, announcement_set
+            amount, SINGLETON_LAUNCHER_PUZZLE_HASH, fee, origin_id, coins, None, False, announcement_set
         )
 
-        genesis_launcher_solution = Program.to([did_puzzle_hash, amount, bytes(0x80)])
-
         launcher_cs = CoinSpend(launcher_coin, genesis_launcher_puz, genesis_launcher_solution)
-        launcher_sb = SpendBundle([launcher_cs], AugSchemeMPL.aggregate([]))
-        eve_coin = Coin(launcher_coin.name(), did_puzzle_hash, amount)
+        eve_coin = Coin(launcher_id, did_puzzle_hash, amount)
         future_parent = LineageProof(
             eve_coin.parent_coin_info,
             did_inner_hash,
@@ -1270,28 +1271,22 @@ class DIDWallet:
             launcher_coin.puzzle_hash,
             uint64(launcher_coin.amount),
         )
-        await self.add_parent(eve_coin.parent_coin_info, eve_parent)
-        await self.add_parent(eve_coin.name(), future_parent)
 
         if tx_record is None or tx_record.spend_bundle is None:
             return None
 
         # Only want to save this information if the transaction is valid
-        did_info: DIDInfo = DIDInfo(
-            launcher_coin,
-            self.did_info.backup_ids,
-            self.did_info.num_of_backup_ids_needed,
-            self.did_info.parent_info,
-            did_inner,
-            None,
-            None,
-            None,
-            False,
-            self.did_info.metadata,
+        await self.save_singleton_state(
+            [(eve_coin.parent_coin_info, eve_parent), (eve_coin.name(), future_parent)],
+            origin_coin=launcher_coin,
+            current_inner=did_inner,
         )
-        await self.save_info(did_info)
         eve_spend = await self.generate_eve_spend(eve_coin, did_full_puz, did_inner)
-        full_spend = SpendBundle.aggregate([tx_record.spend_bundle, eve_spend, launcher_sb])
+        # The launcher spend is unsigned, so only the funding and eve signatures need aggregating
+        full_spend = SpendBundle(
+            [*tx_record.spend_bundle.coin_spends, *eve_spend.coin_spends, launcher_cs],
+            AugSchemeMPL.aggregate([tx_record.spend_bundle.aggregated_signature, eve_spend.aggregated_signature]),
+        )
         assert self.did_info.origin_coin is not None
         assert self.did_info.current_inner is not None
 
@@ -1343,7 +1338,7 @@ class DIDWallet:
             ]
         )
         list_of_coinspends = [CoinSpend(coin, full_puzzle, fullsol)]
-        unsigned_spend_bundle = SpendBundle(list_of_coinspends, G2Element())
+        unsigned_spend_bundle = SpendBundle(list_of_coinspends, NULL_SIGNATURE)
         return await self.sign(unsigned_spend_bundle)
 
     async def get_frozen_amount(self) -> uint64:
@@ -1360,23 +1355,48 @@ class DIDWallet:
 
         return max_send_amount
 
-    async def add_parent(self, name: bytes32, parent: Optional[LineageProof]):
-        self.log.info(f"Adding parent {name}: {parent}")
-        current_list = self.did_info.parent_info.copy()
-        current_list.append((name, parent))
+    async def save_singleton_state(
+        self,
+        parents: List[Tuple[bytes32, Optional[LineageProof]]],
+        *,
+        origin_coin: Optional[Coin],
+        current_inner: Optional[Program],
+        temp_coin: Optional[Coin] = None,
+        temp_puzhash: Optional[bytes32] = None,
+        temp_pubkey: Optional[bytes] = None,
+        sent_recovery_transaction: bool = False,
+    ) -> None:
+        """
+        Save the DID singleton state, appending lineage proofs to the parent info in the same write
+        :param parents: (coin id, lineage proof) pairs to append
+        :param origin_coin: Coin whose ID is our DID
+        :param current_inner: Current inner puzzle of the DID singleton
+        :param temp_coin: Partially recovered coin, if any
+        :param temp_puzhash: Inner puzzle hash of the partially recovered DID, if any
+        :param temp_pubkey: Public key of the partially recovered DID, if any
+        :param sent_recovery_transaction: Whether a recovery transaction has been sent
+        :return: None
+        """
+        for name, parent in parents:
+            self.log.info("Adding parent to DID wallet %s: %s: %s", self.id(), name, parent)
+        previous_parent_info = self.did_info.parent_info
         did_info: DIDInfo = DIDInfo(
-            self.did_info.origin_coin,
+            origin_coin,
             self.did_info.backup_ids,
             self.did_info.num_of_backup_ids_needed,
-            current_list,
-            self.did_info.current_inner,
-            self.did_info.temp_coin,
-            self.did_info.temp_puzhash,
-            self.did_info.temp_pubkey,
-            self.did_info.sent_recovery_transaction,
+            [*previous_parent_info, *parents],
+            current_inner,
+            temp_coin,
+            temp_puzhash,
+            temp_pubkey,
+            sent_recovery_transaction,
             self.did_info.metadata,
         )
         await self.save_info(did_info)
+        # Extend the coin-id index in place instead of rebuilding it on the next lookup
+        if self._parent_info_source is previous_parent_info:
+            self._parent_info_by_coin.update(parents)
+            self._parent_info_source = self.did_info.parent_info
 
     async def update_recovery_list(self, recover_list: List[bytes32], num_of_backup_ids_needed: uint64) -> bool:
         if num_of_backup_ids_needed > len(recover_list):
@@ -1430,9 +1450,9 @@ class DIDWallet:
         max_num = 0
         for wallet in self.wallet_state_manager.wallets.values():
             if wallet.type() == WalletType.DECENTRALIZED_ID:
-                matched = re.search(r"^Profile (\d+)$", wallet.get_name())
-                if matched and int(matched.group(1)) > max_num:
-                    max_num = int(matched.group(1))
+                name = wallet.get_name()
+                if name.startswith("Profile ") and name[8:].isdecimal():
+                    max_num = max(max_num, int(name[8:]))
         return f"Profile {max_num + 1}"
 
     def check_existed_did(self):
@@ -1440,11 +1460,9 @@ class DIDWallet:
         Check if the current DID is existed
         :return: None
         """
+        my_did = self.did_info.origin_coin.name()
         for wallet in self.wallet_state_manager.wallets.values():
-            if (
-                wallet.type() == WalletType.DECENTRALIZED_ID
-                and self.did_info.origin_coin.name() == wallet.did_info.origin_coin.name()
-            ):
+            if wallet.type() == WalletType.DECENTRALIZED_ID and my_did == wallet.did_info.origin_coin.name():
                 self.log.warning(f"DID {self.did_info.origin_coin} already existed, ignore the wallet creation.")
                 raise ValueError("Wallet already exists")
 
@@ -21,6 +21,8 @@ from chia.wallet.util.curry_and_treehash import calculate_hash_of_quoted_mod_has
 
 DID_INNERPUZ_MOD = load_clvm_maybe_recompile("did_innerpuz.clsp")
 DID_INNERPUZ_MOD_HASH = DID_INNERPUZ_MOD.get_tree_hash()
+# Recovery list hash of a DID with no backup IDs
+EMPTY_RECOVERY_LIST_HASH = Program.to([]).get_tree_hash()
 INTERMEDIATE_LAUNCHER_MOD = load_clvm_maybe_recompile("nft_intermediate_launcher.clsp")
 
 
@@ -22,9 +22,9 @@ from chia.types.spend_bundle import SpendBundle
 from chia.util.condition_tools import conditions_dict_for_solution, pkm_pairs_for_conditions_dict
 from chia.util.hash import std_hash
 from chia.util.ints import uint16, uint32, uint64, uint128
+from chia.wallet.cat_wallet.cat_utils import NULL_SIGNATURE
 from chia.wallet.derivation_record import DerivationRecord
 from chia.wallet.did_wallet import did_wallet_puzzles
-from chia.wallet.did_wallet.did_info import DIDInfo
 from chia.wallet.lineage_proof import LineageProof
 from chia.wallet.nft_wallet import nft_puzzles
 from chia.wallet.nft_wallet.nft_info import NFTCoinInfo, NFTWalletInfo
@@ -88,7 +88,7 @@ class NFTWallet:
         self.standard_wallet = wallet
         if name is None:
             name = "NFT Wallet"
-        self.log = logging.getLogger(name if name else __name__)
+        self.log = logging.getLogger(__name__)
         self.wallet_state_manager = wallet_state_manager
         self.nft_wallet_info = NFTWalletInfo(did_id)
         info_as_string = json.dumps(self.nft_wallet_info.to_json_dict())
@@ -109,10 +109,9 @@ class NFTWallet:
         wallet_state_manager: Any,
         wallet: Wallet,
         wallet_info: WalletInfo,
-        name: Optional[str] = None,
     ) -> _T_NFTWallet:
         self = cls()
-        self.log = logging.getLogger(name if name else __name__)
+        self.log = logging.getLogger(__name__)
         self.wallet_state_manager = wallet_state_manager
         self.wallet_info = wallet_info
         self.wallet_id = wallet_info.id
@@ -159,7 +158,7 @@ class NFTWallet:
 
     async def coin_added(self, coin: Coin, height: uint32, peer: WSChiaConnection) -> None:
         """Notification from wallet state manager that wallet has been received."""
-        self.log.info(f"NFT wallet %s has been notified that {coin} was added", self.get_name())
+        self.log.info(f"NFT wallet %s has been notified that {coin} was added", self.id())
         if await self.nft_store.exists(coin.name()):
             # already added
             return
@@ -176,7 +175,7 @@ class NFTWallet:
         await self.puzzle_solution_received(cs, peer)
 
     async def puzzle_solution_received(self, coin_spend: CoinSpend, peer: WSChiaConnection) -> None:
-        self.log.debug("Puzzle solution received to wallet: %s", self.wallet_info)
+        self.log.debug("Puzzle solution received to wallet %s: %s", self.id(), self.wallet_info)
         coin_name = coin_spend.coin.name()
         puzzle: Program = Program.from_bytes(bytes(coin_spend.puzzle_reveal))
         # At this point, the puzzle must be a NFT puzzle.
@@ -200,7 +199,7 @@ class NFTWallet:
         ] = await self.wallet_state_manager.puzzle_store.get_derivation_record_for_puzzle_hash(p2_puzzle_hash)
         self.log.debug("Record for %s is: %s", p2_puzzle_hash, derivation_record)
         if derivation_record is None:
-            self.log.debug("Not our NFT, pointing to %s, skipping", p2_puzzle_hash)
+            self.log.debug("Not our NFT, pointing to %s, skipping for wallet %s", p2_puzzle_hash, self.id())
             return
         p2_puzzle = puzzle_for_pk(derivation_record.pubkey)
         launcher_coin_states: List[CoinState] = await self.wallet_state_manager.wallet_node.get_coin_state(
@@ -242,7 +241,7 @@ class NFTWallet:
         else:
             raise ValueError("Couldn't generate child puzzle for NFT")
 
-        self.log.info("Adding a new NFT to wallet: %s", child_coin)
+        self.log.info("Adding a new NFT to wallet %s: %s", self.id(), child_coin)
         # all is well, lets add NFT to our local db
         parent_coin = None
         confirmed_height = None
@@ -290,18 +289,16 @@ class NFTWallet:
             num = await self.get_nft_count()
             if num == 0 and self.did_id is not None:
                 # Check if the wallet owns the DID
-                for did_wallet in await self.wallet_state_manager.get_all_wallet_info_entries(
-                    wallet_type=WalletType.DECENTRALIZED_ID
-                ):
-                    did_wallet_info: DIDInfo = DIDInfo.from_json_dict(json.loads(did_wallet.data))
-                    assert did_wallet_info.origin_coin is not None
-                    if did_wallet_info.origin_coin.name() == self.did_id:
-                        return
-                self.log.info(f"No NFT, deleting wallet {self.wallet_info.name} ...")
+                for wallet in self.wallet_state_manager.wallets.values():
+                    if wallet.type() == WalletType.DECENTRALIZED_ID:
+                        assert wallet.did_info.origin_coin is not None
+                        if wallet.did_info.origin_coin.name() == self.did_id:
+                            return
+                self.log.info(f"No NFT, deleting wallet {self.wallet_info.id} {self.wallet_info.name} ...")
                 await self.wallet_state_manager.user_store.delete_wallet(self.wallet_info.id)
-                self.wallet_state_manager.wallets.pop(self.wallet_info.id)
+                self.wallet_state_manager.remove_wallet(self.wallet_info.id)
         else:
-            self.log.info("Tried removing NFT coin that doesn't exist: %s", coin.name())
+            self.log.info("Tried removing NFT coin that doesn't exist in wallet %s: %s", self.id(), coin.name())
 
     async def get_did_approval_info(
         self,
@@ -355,11 +352,13 @@ class NFTWallet:
         coins = await self.standard_wallet.select_coins(uint64(amount + fee))
         if coins is None:
             return None
-        origin = coins.copy().pop()
+        origin = next(iter(coins))
         genesis_launcher_puz = nft_puzzles.LAUNCHER_PUZZLE
         # nft_id == singleton_id == launcher_id == launcher_coin.name()
         launcher_coin = Coin(origin.name(), nft_puzzles.LAUNCHER_PUZZLE_HASH, uint64(amount))
-        self.log.debug("Generating NFT with launcher coin %s and metadata: %s", launcher_coin, metadata)
+        self.log.debug(
+            "Wallet %s generating NFT with launcher coin %s and metadata: %s", self.id(), launcher_coin, metadata
+        )
 
         p2_inner_puzzle = await self.standard_wallet.get_new_puzzle()
         if not target_puzzle_hash:
@@ -385,7 +384,8 @@ class NFTWallet:
         eve_fullpuz_hash = eve_fullpuz.get_tree_hash()
         # launcher announcement
         announcement_set: Set[Announcement] = set()
-        announcement_message = Program.to([eve_fullpuz_hash, amount, []]).get_tree_hash()
+        genesis_launcher_solution = Program.to([eve_fullpuz_hash, amount, []])
+        announcement_message = genesis_launcher_solution.get_tree_hash()
         announcement_set.add(Announcement(launcher_coin.name(), announcement_message))
 
         self.log.debug(
@@ -402,16 +402,15 @@ class NFTWallet:
             False,
             announcement_set,
         )
-        genesis_launcher_solution = Program.to([eve_fullpuz_hash, amount, []])
 
         # launcher spend to generate the singleton
         launcher_cs = CoinSpend(launcher_coin, genesis_launcher_puz, genesis_launcher_solution)
-        launcher_sb = SpendBundle([launcher_cs], AugSchemeMPL.aggregate([]))
+        launcher_sb = SpendBundle([launcher_cs], NULL_SIGNATURE)
 
         eve_coin = Coin(launcher_coin.name(), eve_fullpuz_hash, uint64(amount))
 
         if tx_record is None or tx_record.spend_bundle is None:
-            self.log.error("Couldn't produce a launcher spend")
+            self.log.error("Couldn't produce a launcher spend for wallet %s", self.id())
             return None
 
         bundles_to_agg = [tx_record.spend_bundle, launcher_sb]
@@ -479,7 +478,7 @@ class NFTWallet:
                         self.log.debug("Found key, signing for pk: %s", pk)
                         sigs.append(AugSchemeMPL.sign(sk, msg))
                     else:
-                        self.log.warning("Couldn't find key for: %s", pk)
+                        self.log.warning("Wallet %s couldn't find key for: %s", self.id(), pk)
                 except AssertionError:
                     raise ValueError("This spend bundle cannot be signed by the NFT wallet")
 
@@ -499,8 +498,9 @@ class NFTWallet:
         puzzle_hash = uncurried_nft.p2_puzzle.get_tree_hash()
 
         self.log.info(
-            "Attempting to add urls to NFT coin %s in the metadata: %s",
+            "Attempting to add urls to NFT coin %s in wallet %s, the metadata: %s",
             nft_coin_info.coin.name(),
+            self.id(),
             uncurried_nft.metadata,
         )
         txs = await self.generate_signed_transaction(
@@ -767,7 +767,7 @@ class NFTWallet:
         singleton_solution = Program.to([nft_coin.lineage_proof.to_program(), nft_coin.coin.amount, nft_layer_solution])
         coin_spend = CoinSpend(nft_coin.coin, nft_coin.full_puzzle, singleton_solution)
 
-        nft_spend_bundle = SpendBundle([coin_spend], G2Element())
+        nft_spend_bundle = SpendBundle([coin_spend], NULL_SIGNATURE)
 
         return nft_spend_bundle, chia_tx
 
@@ -1083,7 +1083,7 @@ class NFTWallet:
                             royalty_sol = solve_puzzle(driver_dict[asset], solver, DESIRED_OFFER_MOD, inner_royalty_sol)
 
                         new_coin_spend = CoinSpend(royalty_coin, offer_puzzle, royalty_sol)
-                        additional_bundles.append(SpendBundle([new_coin_spend], G2Element()))
+                        additional_bundles.append(SpendBundle([new_coin_spend], NULL_SIGNATURE))
 
                         if duplicate_payments != []:
                             payments = duplicate_payments
@@ -1109,7 +1109,7 @@ class NFTWallet:
         announcement_ids: List[bytes32] = [],
         reuse_puzhash: Optional[bool] = None,
     ) -> List[TransactionRecord]:
-        self.log.debug("Setting NFT DID with parameters: nft=%s did=%s", nft_list, did_id)
+        self.log.debug("Setting NFT DID with parameters: wallet=%s nft=%s did=%s", self.id(), nft_list, did_id)
         did_inner_hash = b""
         nft_ids = []
         nft_tx_record = []
@@ -1160,7 +1160,7 @@ class NFTWallet:
         fee: uint64 = uint64(0),
         reuse_puzhash: Optional[bool] = None,
     ) -> List[TransactionRecord]:
-        self.log.debug("Transfer NFTs %s to %s", nft_list, puzzle_hash.hex())
+        self.log.debug("Transfer NFTs %s from wallet %s to %s", nft_list, self.id(), puzzle_hash.hex())
         nft_tx_record = []
         spend_bundles = []
         first = True
@@ -1199,7 +1199,7 @@ class NFTWallet:
         fee: uint64 = uint64(0),
         reuse_puzhash: Optional[bool] = None,
     ) -> SpendBundle:
-        self.log.debug("Setting NFT DID with parameters: nft=%s did=%s", nft_coin_info, did_id)
+        self.log.debug("Setting NFT DID with parameters: wallet=%s nft=%s did=%s", self.id(), nft_coin_info, did_id)
         unft = UncurriedNFT.uncurry(*nft_coin_info.full_puzzle.uncurry())
         assert unft is not None
         nft_id = unft.singleton_launcher_id
@@ -1526,7 +1526,7 @@ class NFTWallet:
 
         # Collect up all the coin spends and sign them
         list_of_coinspends = [did_spend] + intermediate_coin_spends + launcher_spends
-        unsigned_spend_bundle = SpendBundle(list_of_coinspends, G2Element())
+        unsigned_spend_bundle = SpendBundle(list_of_coinspends, NULL_SIGNATURE)
         signed_spend_bundle = await did_wallet.sign(unsigned_spend_bundle)
 
         # Aggregate everything into a single spend bundle
@@ -1571,7 +1571,7 @@ class NFTWallet:
             xch_coins = await self.standard_wallet.select_coins(uint64(total_amount))
         assert len(xch_coins) > 0
 
-        funding_coin = xch_coins.copy().pop()
+        funding_coin = next(iter(xch_coins))
 
         # set the chunk size for the spend bundle we're going to create
         chunk_size = len(metadata_list)
@@ -1738,7 +1738,7 @@ class NFTWallet:
 
         # Collect up all the coin spends and sign them
         list_of_coinspends = intermediate_coin_spends + launcher_spends
-        unsigned_spend_bundle = SpendBundle(list_of_coinspends, G2Element())
+        unsigned_spend_bundle = SpendBundle(list_of_coinspends, NULL_SIGNATURE)
         signed_spend_bundle = await self.sign(unsigned_spend_bundle)
 
         # Aggregate everything into a single spend bundle
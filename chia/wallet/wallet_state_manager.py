@@ -53,7 +53,7 @@ from chia.wallet.derive_keys import (
     master_sk_to_wallet_sk_unhardened_intermediate,
 )
 from chia.wallet.did_wallet.did_wallet import DIDWallet
-from chia.wallet.did_wallet.did_wallet_puzzles import DID_INNERPUZ_MOD, match_did_puzzle
+from chia.wallet.did_wallet.did_wallet_puzzles import DID_INNERPUZ_MOD, EMPTY_RECOVERY_LIST_HASH, match_did_puzzle
 from chia.wallet.key_val_store import KeyValStore
 from chia.wallet.nft_wallet.nft_puzzles import get_metadata_and_phs, get_new_owner_did
 from chia.wallet.nft_wallet.nft_wallet import NFTWallet
@@ -117,6 +117,8 @@ class WalletStateManager:
 
     main_wallet: Wallet
     wallets: Dict[uint32, WalletProtocol]
+    # CAT tail hash -> wallet id for every CAT wallet in self.wallets
+    cat_wallet_ids_by_tail: Dict[bytes32, uint32]
     private_key: PrivateKey
 
     trade_manager: TradeManager
@@ -200,6 +202,7 @@ class WalletStateManager:
         self.main_wallet = await Wallet.create(self, main_wallet_info)
 
         self.wallets = {main_wallet_info.id: self.main_wallet}
+        self.cat_wallet_ids_by_tail = {}
 
         self.asset_to_wallet_map = {
             AssetType.CAT: CATWallet,
@@ -240,6 +243,8 @@ class WalletStateManager:
                 wallet = await DataLayerWallet.create(self, wallet_info)
             if wallet is not None:
                 self.wallets[wallet_info.id] = wallet
+                if isinstance(wallet, CATWallet):
+                    self.cat_wallet_ids_by_tail[wallet.cat_info.limitations_program_hash] = wallet.id()
 
         return self
 
@@ -783,7 +788,7 @@ class WalletStateManager:
                     await self.user_store.delete_wallet(wallet.id())
                     removed_wallet_ids.append(wallet.id())
             for remove_id in removed_wallet_ids:
-                self.wallets.pop(remove_id)
+                self.remove_wallet(remove_id)
                 self.log.info(f"Removed DID wallet {remove_id}, Launch_ID: {launch_id.hex()}")
                 self.state_changed("wallet_removed", remove_id)
             return None
@@ -796,7 +801,7 @@ class WalletStateManager:
             )
             full_puzzle = create_singleton_puzzle(did_puzzle, launch_id)
             did_puzzle_empty_recovery = DID_INNERPUZ_MOD.curry(
-                our_inner_puzzle, Program.to([]).get_tree_hash(), uint64(0), singleton_struct, metadata
+                our_inner_puzzle, EMPTY_RECOVERY_LIST_HASH, uint64(0), singleton_struct, metadata
             )
             full_puzzle_empty_recovery = create_singleton_puzzle(did_puzzle_empty_recovery, launch_id)
             if full_puzzle.get_tree_hash() != coin_state.coin.puzzle_hash:
@@ -939,7 +944,7 @@ class WalletStateManager:
                     if is_empty and nft_wallet.did_id is not None and not has_did:
                         self.log.info(f"No NFT, deleting wallet {nft_wallet.did_id.hex()} ...")
                         await self.user_store.delete_wallet(nft_wallet.wallet_info.id)
-                        self.wallets.pop(nft_wallet.wallet_info.id)
+                        self.remove_wallet(nft_wallet.wallet_info.id)
             if nft_wallet.nft_wallet_info.did_id == new_did_id and new_derivation_record is not None:
                 self.log.info(
                     "Adding new NFT, NFT_ID:%s, DID_ID:%s",
@@ -990,9 +995,11 @@ class WalletStateManager:
             self.log.debug("Add coin state: %s: %s", coin_name, coin_state)
             local_record = local_records.get(coin_name)
             rollback_wallets = None
+            rollback_cat_wallet_ids = None
             try:
                 async with self.db_wrapper.writer():
                     rollback_wallets = self.wallets.copy()  # Shallow copy of wallets if writer rolls back the db
+                    rollback_cat_wallet_ids = self.cat_wallet_ids_by_tail.copy()
                     # This only succeeds if we don't raise out of the transaction
                     await self.retry_store.remove_state(coin_state)
 
@@ -1326,6 +1333,8 @@ class WalletStateManager:
                 self.log.exception(f"Failed to add coin_state: {coin_state}, error: {e}")
                 if rollback_wallets is not None:
                     self.wallets = rollback_wallets  # Restore since DB will be rolled back by writer
+                if rollback_cat_wallet_ids is not None:
+                    self.cat_wallet_ids_by_tail = rollback_cat_wallet_ids
                 if isinstance(e, PeerRequestException) or isinstance(e, aiosqlite.Error):
                     await self.retry_store.add_state(coin_state, peer.peer_node_id, fork_height)
                 else:
@@ -1621,19 +1630,31 @@ class WalletStateManager:
     async def get_all_wallet_info_entries(self, wallet_type: Optional[WalletType] = None) -> List[WalletInfo]:
         return await self.user_store.get_all_wallet_info_entries(wallet_type)
 
+    def get_cat_wallet_for_tail(self, tail_hash: bytes32) -> Optional[CATWallet]:
+        wallet_id = self.cat_wallet_ids_by_tail.get(tail_hash)
+        if wallet_id is None:
+            return None
+        wallet = self.wallets.get(wallet_id)
+        if isinstance(wallet, CATWallet) and wallet.cat_info.limitations_program_hash == tail_hash:
+            return wallet
+        return None
+
     async def get_wallet_for_asset_id(self, asset_id: str):
+        try:
+            asset_hash = bytes32.from_hexstr(asset_id)
+        except ValueError:
+            return None
+        cat_wallet = self.get_cat_wallet_for_tail(asset_hash)
+        if cat_wallet is not None:
+            return cat_wallet
         for wallet_id, wallet in self.wallets.items():
-            if wallet.type() == WalletType.CAT:
-                assert isinstance(wallet, CATWallet)
-                if bytes(wallet.cat_info.limitations_program_hash).hex() == asset_id:
-                    return wallet
-            elif wallet.type() == WalletType.DATA_LAYER:
+            if wallet.type() == WalletType.DATA_LAYER:
                 assert isinstance(wallet, DataLayerWallet)
-                if await wallet.get_latest_singleton(bytes32.from_hexstr(asset_id)) is not None:
+                if await wallet.get_latest_singleton(asset_hash) is not None:
                     return wallet
             elif wallet.type() == WalletType.NFT:
                 assert isinstance(wallet, NFTWallet)
-                nft_coin = await self.nft_store.get_nft_by_id(bytes32.from_hexstr(asset_id), wallet_id)
+                nft_coin = await self.nft_store.get_nft_by_id(asset_hash, wallet_id)
                 if nft_coin:
                     return wallet
         return None
@@ -1657,9 +1678,16 @@ class WalletStateManager:
 
     async def add_new_wallet(self, wallet: WalletProtocol) -> None:
         self.wallets[wallet.id()] = wallet
+        if isinstance(wallet, CATWallet):
+            self.cat_wallet_ids_by_tail[wallet.cat_info.limitations_program_hash] = wallet.id()
         await self.create_more_puzzle_hashes()
         self.state_changed("wallet_created")
 
+    def remove_wallet(self, wallet_id: uint32) -> None:
+        wallet = self.wallets.pop(wallet_id)
+        if isinstance(wallet, CATWallet):
+            self.cat_wallet_ids_by_tail.pop(wallet.cat_info.limitations_program_hash, None)
+
     async def get_spendable_coins_for_wallet(
         self, wallet_id: int, records: Optional[Set[WalletCoinRecord]] = None
     ) -> Set[WalletCoinRecord]:
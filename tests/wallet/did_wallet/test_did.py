@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import dataclasses
 import json
-from typing import Optional
+import logging
+from typing import List, Optional
 
 import pytest
 from blspy import AugSchemeMPL, G1Element, G2Element
@@ -12,6 +13,7 @@ from chia.rpc.wallet_rpc_api import WalletRpcApi
 from chia.simulator.setup_nodes import SimulatorsAndWallets
 from chia.simulator.simulator_protocol import FarmNewBlockProtocol
 from chia.simulator.time_out_assert import time_out_assert, time_out_assert_not_none
+from chia.types.blockchain_format.coin import Coin
 from chia.types.blockchain_format.program import Program
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.types.condition_opcodes import ConditionOpcode
@@ -19,12 +21,16 @@ from chia.types.peer_info import PeerInfo
 from chia.types.spend_bundle import SpendBundle
 from chia.util.bech32m import decode_puzzle_hash, encode_puzzle_hash
 from chia.util.condition_tools import conditions_dict_for_solution
-from chia.util.ints import uint16, uint32, uint64
+from chia.util.ints import uint8, uint16, uint32, uint64
+from chia.wallet.did_wallet import did_wallet_puzzles
+from chia.wallet.did_wallet.did_info import DIDInfo
 from chia.wallet.did_wallet.did_wallet import DIDWallet
+from chia.wallet.lineage_proof import LineageProof
 from chia.wallet.singleton import create_singleton_puzzle
 from chia.wallet.util.address_type import AddressType
 from chia.wallet.util.wallet_types import WalletType
 from chia.wallet.wallet import CHIP_0002_SIGN_MESSAGE_PREFIX
+from chia.wallet.wallet_info import WalletInfo
 
 
 async def get_wallet_num(wallet_manager):
@@ -1402,3 +1408,69 @@ class TestDIDWallet:
         #    json.loads(all_node_0_wallets[1].data)["current_inner"]
         #    == json.loads(all_node_1_wallets[1].data)["current_inner"]
         # )
+
+
+def test_get_parent_for_coin_tracks_parent_info() -> None:
+    did_wallet = DIDWallet()
+    parent_id = bytes32(b"\x01" * 32)
+    first = LineageProof(bytes32(b"\x02" * 32), bytes32(b"\x03" * 32), uint64(1))
+    latest = LineageProof(bytes32(b"\x04" * 32), bytes32(b"\x05" * 32), uint64(1))
+    did_info = DIDInfo(None, [], uint64(0), [(parent_id, first)], None, None, None, None, False, "{}")
+    did_wallet.did_info = did_info
+    coin = Coin(parent_id, bytes32(b"\x06" * 32), uint64(1))
+    assert did_wallet.get_parent_for_coin(coin) == first
+    assert did_wallet.get_parent_for_coin(Coin(bytes32(b"\x07" * 32), parent_id, uint64(1))) is None
+
+    # Replacing did_info must invalidate the lookup, and the last entry for a coin wins
+    did_wallet.did_info = dataclasses.replace(did_info, parent_info=[(parent_id, first), (parent_id, latest)])
+    assert did_wallet.get_parent_for_coin(coin) == latest
+
+
+class StubUserStore:
+    def __init__(self) -> None:
+        self.saved: List[WalletInfo] = []
+
+    async def update_wallet(self, wallet_info: WalletInfo) -> None:
+        self.saved.append(wallet_info)
+
+
+class StubWalletStateManager:
+    def __init__(self) -> None:
+        self.user_store = StubUserStore()
+
+
+@pytest.mark.asyncio
+async def test_save_singleton_state_extends_parent_lookup() -> None:
+    did_wallet = DIDWallet()
+    did_wallet.log = logging.getLogger(__name__)
+    did_wallet.wallet_state_manager = StubWalletStateManager()
+    did_wallet.wallet_info = WalletInfo(uint32(2), "DID", uint8(WalletType.DECENTRALIZED_ID), "")
+    parent_id = bytes32(b"\x01" * 32)
+    new_id = bytes32(b"\x08" * 32)
+    first = LineageProof(bytes32(b"\x02" * 32), bytes32(b"\x03" * 32), uint64(1))
+    latest = LineageProof(bytes32(b"\x04" * 32), bytes32(b"\x05" * 32), uint64(1))
+    other = LineageProof(bytes32(b"\x06" * 32), bytes32(b"\x07" * 32), uint64(1))
+    did_wallet.did_info = DIDInfo(None, [], uint64(0), [(parent_id, first)], None, None, None, None, False, "{}")
+    coin = Coin(parent_id, bytes32(b"\x09" * 32), uint64(1))
+    assert did_wallet.get_parent_for_coin(coin) == first
+
+    # New parents are found after a lookup has already been made, and the last duplicate wins
+    await did_wallet.save_singleton_state(
+        [(parent_id, latest), (new_id, other)], origin_coin=None, current_inner=None, sent_recovery_transaction=True
+    )
+    assert did_wallet.did_info.sent_recovery_transaction
+    assert did_wallet.did_info.parent_info == [(parent_id, first), (parent_id, latest), (new_id, other)]
+    assert did_wallet.get_parent_for_coin(coin) == latest
+    assert did_wallet.get_parent_for_coin(Coin(new_id, bytes32(b"\x09" * 32), uint64(1))) == other
+    assert len(did_wallet.wallet_state_manager.user_store.saved) == 1
+
+
+def test_metadata_program_follows_did_info() -> None:
+    did_wallet = DIDWallet()
+    did_wallet.did_info = DIDInfo(None, [], uint64(0), [], None, None, None, None, False, json.dumps({"a": "1"}))
+    first = did_wallet._get_metadata_program()
+    assert first == did_wallet_puzzles.metadata_to_program({"a": "1"})
+    assert did_wallet._get_metadata_program() is first
+
+    did_wallet.did_info = dataclasses.replace(did_wallet.did_info, metadata=json.dumps({"a": "2"}))
+    assert did_wallet._get_metadata_program() == did_wallet_puzzles.metadata_to_program({"a": "2"})
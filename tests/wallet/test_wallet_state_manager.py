@@ -6,7 +6,9 @@ from typing import AsyncIterator
 import pytest
 
 from chia.simulator.setup_nodes import SimulatorsAndWallets
+from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.util.ints import uint32
+from chia.wallet.cat_wallet.cat_wallet import CATWallet
 from chia.wallet.wallet_state_manager import WalletStateManager
 
 
@@ -44,3 +46,22 @@ async def test_set_sync_mode_exception(simulator_and_wallet: SimulatorsAndWallet
     _, [(wallet_node, _)], _ = simulator_and_wallet
     async with assert_sync_mode(wallet_node.wallet_state_manager, uint32(1)):
         raise Exception
+
+
+@pytest.mark.asyncio
+async def test_get_cat_wallet_for_tail(simulator_and_wallet: SimulatorsAndWallets) -> None:
+    _, [(wallet_node, _)], _ = simulator_and_wallet
+    wsm = wallet_node.wallet_state_manager
+    tail_hash = bytes32([1] * 32)
+    assert wsm.get_cat_wallet_for_tail(tail_hash) is None
+    assert await wsm.get_wallet_for_asset_id("not hex") is None
+
+    cat_wallet = await CATWallet.get_or_create_wallet_for_cat(wsm, wsm.main_wallet, tail_hash.hex())
+    assert wsm.get_cat_wallet_for_tail(tail_hash) is cat_wallet
+    assert await wsm.get_wallet_for_asset_id(tail_hash.hex()) is cat_wallet
+    assert await CATWallet.get_or_create_wallet_for_cat(wsm, wsm.main_wallet, tail_hash.hex()) is cat_wallet
+
+    wsm.remove_wallet(cat_wallet.id())
+    assert tail_hash not in wsm.cat_wallet_ids_by_tail
+    assert wsm.get_cat_wallet_for_tail(tail_hash) is None
+    assert await wsm.get_wallet_for_asset_id(tail_hash.hex()) is None